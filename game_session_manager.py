@@ -68,14 +68,14 @@ class GameSessionManager:
 
     def end_session(self, user_id: int):
         """Ends a user's game session"""
-        if user_id in self.sessions:
-            session = self.sessions[user_id]
-            if session.message_id:
-                self.logger.info(f"Cleaning up message {session.message_id} for user {user_id}")
-                self.message_to_session.pop(session.message_id, None)
-            session.state = SessionState.ENDED
-            del self.sessions[user_id]
-            self.logger.info(f"Session ended for user {user_id}")
+        session = self.sessions.pop(user_id, None)
+        if session is None:
+            return
+        if session.message_id:
+            self.logger.info(f"Cleaning up message {session.message_id} for user {user_id}")
+            self.message_to_session.pop(session.message_id, None)
+        session.state = SessionState.ENDED
+        self.logger.info(f"Session ended for user {user_id}")
 
     def get_session(self, user_id: int) -> Optional[GameSession]:
         """Gets an active session for a user"""
@@ -94,47 +94,60 @@ class GameSessionManager:
         else:
             self.logger.warning(f"Attempted to register message for non-existent session: user={user_id}, message={message_id}")
 
+    async def send_notice(self, client: discord.Client, session: GameSession, message: str, kind: str) -> bool:
+        """Posts a short-lived notice in the session's channel. Returns whether it was sent"""
+        try:
+            channel = client.get_channel(session.channel_id)
+            if channel:
+                await channel.send(message, delete_after=300)  # Delete after 5 minutes
+                return True
+        except Exception as e:
+            logger.error(f"Failed to send {kind} message: {e}")
+        return False
+
     async def check_sessions(self, client: discord.Client) -> list[int]:
         """
         Checks all sessions and sends warnings or expires them as needed.
         Returns list of expired session user IDs.
         """
         expired_sessions = []
+        warned_sessions = []
+        warnings = []
+        expirations = []
         
+        # Everything up to the sends is synchronous, so this pass sees a consistent snapshot
         for user_id, session in self.sessions.items():
             state = session.get_state(self.warning_minutes, self.timeout_minutes)
             
             if state == SessionState.WARNING and not session.warning_sent:
-                try:
-                    channel = client.get_channel(session.channel_id)
-                    if channel:
-                        await channel.send(
-                            f"<@{user_id}> Your game session will expire in "
-                            f"{self.timeout_minutes - self.warning_minutes} minutes due to inactivity. "
-                            "Make a move to keep playing!",
-                            delete_after=300  # Delete after 5 minutes
-                        )
-                        session.warning_sent = True
-                except Exception as e:
-                    logger.error(f"Failed to send warning message: {e}")
+                warned_sessions.append(session)
+                warnings.append(self.send_notice(
+                    client, session,
+                    f"<@{user_id}> Your game session will expire in "
+                    f"{self.timeout_minutes - self.warning_minutes} minutes due to inactivity. "
+                    "Make a move to keep playing!",
+                    "warning"
+                ))
 
             elif state == SessionState.EXPIRED:
                 expired_sessions.append(user_id)
-                try:
-                    channel = client.get_channel(session.channel_id)
-                    if channel:
-                        await channel.send(
-                            f"<@{user_id}> Your game session has expired due to inactivity. "
-                            "Use `/start` to begin a new game!",
-                            delete_after=300  # Delete after 5 minutes
-                        )
-                except Exception as e:
-                    logger.error(f"Failed to send expiration message: {e}")
+                expirations.append(self.send_notice(
+                    client, session,
+                    f"<@{user_id}> Your game session has expired due to inactivity. "
+                    "Use `/start` to begin a new game!",
+                    "expiration"
+                ))
 
-        # Clean up expired sessions
+        # Clean up expired sessions before yielding to the event loop
         for user_id in expired_sessions:
             self.end_session(user_id)
 
+        # Send every notice concurrently instead of one channel round-trip at a time
+        results = await asyncio.gather(*warnings, *expirations)
+        for session, sent in zip(warned_sessions, results):
+            if sent:
+                session.warning_sent = True
+
         return expired_sessions
 
     async def handle_interaction(self, interaction: discord.Interaction) -> tuple[bool, str]:
@@ -286,8 +299,7 @@ class ChoiceButton(discord.ui.Button):
                 await interaction.edit_original_response(embed=victory_embed, view=None)
                 
                 # Clean up completed game
-                if interaction.user.id in view.game.active_games:
-                    del view.game.active_games[interaction.user.id]
+                view.game.sessions.pop(interaction.user.id, None)
                 return
             
             # Continue to next scene
@@ -1,24 +1,32 @@
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord import app_commands
 import os
 from dotenv import load_dotenv
 import random
 import datetime
-from typing import Dict, List, Optional
-import json
+from typing import Awaitable, Callable, Dict, List, Optional
+import orjson
 import asyncio
 import openai
 import aiohttp
+import aiosqlite
 import io
 import base64
 from PIL import Image
 import logging
-from openai import OpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+import httpx
+import importlib.util
 import time
 from game_session_manager import GameSessionManager
 from datetime import datetime, timedelta
-import uuid
+import functools
+from dataclasses import dataclass, field
+import copy
+import hashlib
+import re
+from collections import OrderedDict
 
 # Load environment variables
 load_dotenv()
@@ -28,7 +36,7 @@ openai.api_key = os.getenv('OPENAI_API_KEY')
 
 # Set up logging
 logger = logging.getLogger('AdventureGame')
-logger.setLevel(logging.DEBUG)  # Change to DEBUG for more detail
+logger.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())  # Set LOG_LEVEL=DEBUG for more detail
 handler = logging.StreamHandler()
 formatter = logging.Formatter('[%(asctime)s] [%(levelname)s] %(name)s: %(message)s')
 handler.setFormatter(formatter)
@@ -40,63 +48,271 @@ session_manager = GameSessionManager()
 # At the top level of your script
 # client = MyClient()
 # game = AdventureGame()
-# openai_client = OpenAI()  # Initialize once
+# openai_client = AsyncOpenAI()  # Initialize once
+
+# ---- Prompt Templates ----
+# Each request sends a fixed *_SYSTEM message followed by a *_PROMPT user message filled in
+# with str.format. Keeping everything dynamic out of the system message gives every request
+# the same prefix, which is what OpenAI's automatic prompt caching keys on.
+
+SCENE_SYSTEM = """Create the next scene of a text adventure from the details you are given.
+
+        CRITICAL RULES:
+        1. Description MUST be ONE SHORT, DRY, WITTY sentence
+        2. Think Douglas Adams meets Portal's GLaDOS
+        3. NO flowery language or long descriptions
+        4. Choices must be under 80 chars and clever
+        5. IMPORTANT: ALL choices and descriptions MUST relate to the quest
+        6. IMPORTANT: EVERY scene MUST advance the story toward the main goal
+        7. STICK TO THE THEME - no random new elements that weren't established
+        
+        Examples of GOOD descriptions:
+        - "The quantum AI has decided to become a stand-up comedian, and nobody has the heart to tell it it's not funny."
+        - "Turns out uploading consciousness to the cloud wasn't great for data storage costs."
+        - "The memes have unionized and are demanding better working conditions."
+        
+        Examples of BAD descriptions:
+        - Anything longer than one sentence
+        - Flowery or dramatic language
+        - Generic fantasy/sci-fi descriptions
+        - ANYTHING that doesn't directly relate to the established quest theme
+        
+        Return ONLY JSON, using the success rates you are given:
+        {
+            "description": "ONE short, witty sentence",
+            "choices": [
+                {"text": "Clever choice (max 80 chars)", "success_rate": safe success rate},
+                {"text": "Witty risky choice (max 80 chars)", "success_rate": risky success rate}
+            ]
+        }"""
+
+NEXT_SCENE_PROMPT = """Quest: {quest_name}
+        Main Goal: {main_goal}
+        Setting: {setting}
+        Previous Choice: {previous_choice}
+        Success: {success}
+        Current Scene: {scene_number}/{total_scenes}
+        Safe Success Rate: {safe_rate}
+        Risky Success Rate: {risky_rate}
+        {choice_context}"""
+
+FAILURE_SYSTEM = """Write a SHORT, contextual failure message for the failed action you are given.
+
+            CRITICAL RULES:
+            1. Keep it short (1-2 sentences)
+            2. Message MUST directly relate to the scene and action
+            3. Maintain the serious sci-fi/tech tone
+            4. NO random elements unrelated to the scene
+            5. NO silly memes or internet references
+
+            Return ONLY JSON:
+            {
+                "message": "Short, contextual failure message"
+            }"""
+
+FAILURE_PROMPT = """Scene: {scene}
+            Failed Action: {choice_text}
+            Roll: {roll_text}"""
+
+FAILURE_AND_NEXT_SYSTEM = """Write a SHORT, contextual failure message AND the next scene of a text adventure
+        from the details you are given.
+
+        FAILURE MESSAGE RULES:
+        1. Keep it short (1-2 sentences)
+        2. Message MUST directly relate to the scene and action
+        3. Maintain the serious sci-fi/tech tone
+        4. NO random elements unrelated to the scene
+        5. NO silly memes or internet references
+
+        NEXT SCENE RULES:
+        1. Description MUST be ONE SHORT, DRY, WITTY sentence that follows from the failure
+        2. Think Douglas Adams meets Portal's GLaDOS
+        3. NO flowery language or long descriptions
+        4. Choices must be under 80 chars and clever
+        5. IMPORTANT: ALL choices and descriptions MUST relate to the quest
+        6. IMPORTANT: EVERY scene MUST advance the story toward the main goal
+        7. STICK TO THE THEME - no random new elements that weren't established
+
+        Return ONLY JSON, using the success rates you are given:
+        {
+            "failure_message": "Short, contextual failure message",
+            "next_scene": {
+                "description": "ONE short, witty sentence",
+                "choices": [
+                    {"text": "Clever choice (max 80 chars)", "success_rate": safe success rate},
+                    {"text": "Witty risky choice (max 80 chars)", "success_rate": risky success rate}
+                ]
+            }
+        }"""
+
+FAILURE_AND_NEXT_PROMPT = """Quest: {quest_name}
+        Main Goal: {main_goal}
+        Setting: {setting}
+        Scene: {scene}
+        Failed Action: {choice_text}
+        Roll: {roll_text}
+        Next Scene: {scene_number}/{total_scenes}
+        Safe Success Rate: {safe_rate}
+        Risky Success Rate: {risky_rate}
+        {choice_context}"""
+
+VICTORY_SYSTEM = """Create the victory scene that ends a text adventure, from the journey you are given.
+        
+        Create a self-aware, witty conclusion that references:
+        1. The player's specific choices throughout their journey
+        2. Any failures or setbacks they encountered
+        3. The main quest objective and how it was resolved
+        4. Be Douglas Adams meets Portal's GLaDOS in tone (dry humor)
+        
+        Return ONLY JSON:
+        {
+            "title": "A clever, punchy victory title",
+            "description": "2-3 sentences describing the victory that references specific player choices",
+            "quest_status": "One line final status with dry humor",
+            "reward": "Unique reward that fits the story and player's journey",
+            "epilogue": "A single funny line about what happens after the adventure"
+        }"""
+
+VICTORY_PROMPT = """Quest: {quest_name}
+        Main Goal: {main_goal}
+        Setting: {setting}
+        Theme: {theme_style}
+        Final Choice: {final_choice}
+        Success: {success}
+        Lives Remaining: {lives_remaining}/{max_lives}
+        
+        {choice_narrative}"""
+
+# One line per past choice in NEXT_SCENE_PROMPT / FAILURE_AND_NEXT_PROMPT / VICTORY_PROMPT,
+# filled straight from a choice_history entry with format_map
+CHOICE_LINE = "- Scene {scene}: {choice} ({outcome})"
+
+# Needs no details, so it goes out as the system message on its own
+STRUCTURE_AND_OPENING_PROMPT = """Create a COMPLETELY UNEXPECTED adventure scenario AND its opening scene.
+
+            ABSOLUTELY BANNED TOPICS:
+            - NO food, cooking, restaurants, or eating
+            - NO service industry or customer service
+            - NO generic "save the world" plots
+            - NO standard fantasy/sci-fi tropes
+            - NO basic AI gone rogue stories
+            
+            Think WILD situations like:
+            - A bureaucratic war between parallel universes over who owns the color blue
+            - Debugging a social network where memes have gained sentience and started a cult
+            - Fixing a glitch where corporate buzzwords physically manifest as eldritch horrors
+            - Managing a crisis where everyone's dreams got converted into cryptocurrency
+            - Resolving a dispute between time travelers and their future selves over playlist rights
+            - Preventing quantum physics from becoming self-aware and filing for personhood
+            - Dealing with a reality where puns have become weapons of mass destruction
+            
+            SCENARIO RULES:
+            1. Must combine UNRELATED concepts in mind-bending ways
+            2. Should be both absurd AND logical within its own rules
+            3. Must make players think "I can't believe this makes sense"
+            4. Dark humor and existential comedy encouraged
+            5. Should feel like a Douglas Adams plot on acid
+            
+            OPENING SCENE RULES:
+            1. Description MUST be ONE SHORT, DRY, WITTY sentence set in the scenario above
+            2. Think Douglas Adams meets Portal's GLaDOS
+            3. NO flowery language or long descriptions
+            4. Choices must be under 80 chars and clever
+            
+            Examples of GOOD opening descriptions:
+            - "The simulation's warranty expired, and reality is showing pop-up ads."
+            - "Someone taught AI about existential dread, and now it won't stop posting on Reddit."
+            
+            Return ONLY JSON:
+            {
+                "structure": {
+                    "total_scenes": 5,
+                    "quest_name": "Title that makes you do a double-take",
+                    "main_goal": "Objective that sounds insane but follows dream logic",
+                    "setting": "Location that defies normal space-time",
+                    "theme_style": "Two conflicting concepts forced together"
+                },
+                "opening_scene": {
+                    "description": "ONE short, witty sentence",
+                    "choices": [
+                        {"text": "Clever but safe choice", "success_rate": 70},
+                        {"text": "Witty but risky choice", "success_rate": 40}
+                    ]
+                }
+            }"""
 
 # ---- Data Classes ----
 
 class StoryRepository:
-    def __init__(self, db_path="stories.json"):
+    """Stores finished stories in SQLite so adding one is a single insert rather than a full file rewrite"""
+
+    def __init__(self, db_path="stories.db"):
         self.db_path = db_path
-        self.stories = self._load_stories()
+        self.db: Optional[aiosqlite.Connection] = None
     
-    def _load_stories(self):
-        try:
-            with open(self.db_path, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return {"themes": {}, "scenes": {}}
+    async def open(self):
+        """Connect to the database and create the tables if needed"""
+        self.db = await aiosqlite.connect(self.db_path)
+        await self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS scenes (id TEXT PRIMARY KEY, data BLOB NOT NULL);
+            CREATE TABLE IF NOT EXISTS theme_sequences (theme TEXT NOT NULL, seq BLOB NOT NULL);
+            CREATE INDEX IF NOT EXISTS idx_theme_sequences_theme ON theme_sequences (theme);
+        """)
+        await self.db.commit()
     
-    def _save_stories(self):
-        with open(self.db_path, 'w') as f:
-            json.dump(self.stories, f, indent=2)
+    async def close(self):
+        if self.db is not None:
+            await self.db.close()
+            self.db = None
     
-    def add_story(self, theme: str, scenes: List[Dict]):
+    async def add_story(self, theme: str, scenes: List[Dict]):
         """Add a complete story branch to the repository"""
         theme_key = theme.lower().replace(" ", "_")
-        if theme_key not in self.stories["themes"]:
-            self.stories["themes"][theme_key] = []
         
-        # Store unique scenes
+        # Store unique scenes - INSERT OR IGNORE keeps the first copy of each scene id
+        rows = []
         for scene in scenes:
-            scene_id = scene['id']
-            if scene_id not in self.stories["scenes"]:
-                # Only store image if it's a success scene
-                if 'image' in scene and any(
-                    'success' in path and path['success'] in scene['description']
-                    for path in scene['paths']
-                ):
-                    self.stories["scenes"][scene_id] = scene
-                else:
-                    # Store scene without image to save space
-                    scene_copy = scene.copy()
-                    scene_copy.pop('image', None)
-                    self.stories["scenes"][scene_id] = scene_copy
+            # Only store image if it's a success scene
+            if scene.get('is_success') and 'image' in scene:
+                rows.append((scene['id'], orjson.dumps(scene)))
+            else:
+                # Store scene without image to save space
+                scene_copy = scene.copy()
+                scene_copy.pop('image', None)
+                rows.append((scene['id'], orjson.dumps(scene_copy)))
+        await self.db.executemany("INSERT OR IGNORE INTO scenes (id, data) VALUES (?, ?)", rows)
         
         # Store the scene sequence
         story_sequence = [scene['id'] for scene in scenes]
-        self.stories["themes"][theme_key].append(story_sequence)
-        self._save_stories()
+        await self.db.execute(
+            "INSERT INTO theme_sequences (theme, seq) VALUES (?, ?)",
+            (theme_key, orjson.dumps(story_sequence))
+        )
+        await self.db.commit()
 
-    def get_random_story(self, theme: str) -> Optional[List[Dict]]:
+    async def get_random_story(self, theme: str) -> Optional[List[Dict]]:
         """Get a random complete story for a theme"""
         theme_key = theme.lower().replace(" ", "_")
-        if theme_key not in self.stories["themes"]:
+        async with self.db.execute(
+            "SELECT seq FROM theme_sequences WHERE theme = ? ORDER BY RANDOM() LIMIT 1",
+            (theme_key,)
+        ) as cursor:
+            row = await cursor.fetchone()
+        if row is None:
             return None
         
-        story_sequence = random.choice(self.stories["themes"][theme_key])
-        return [self.stories["scenes"][scene_id] for scene_id in story_sequence]
+        story_sequence = orjson.loads(row[0])
+        placeholders = ", ".join("?" * len(story_sequence))
+        async with self.db.execute(
+            f"SELECT id, data FROM scenes WHERE id IN ({placeholders})",
+            story_sequence
+        ) as cursor:
+            scenes = {scene_id: orjson.loads(data) async for scene_id, data in cursor}
+        return [scenes[scene_id] for scene_id in story_sequence]
 
 class Item:
+    __slots__ = ("id", "name", "rarity", "description", "effects")
+
     def __init__(self, id: str, name: str, rarity: str, description: str, effects: dict = None):
         self.id = id
         self.name = name
@@ -105,11 +321,14 @@ class Item:
         self.effects = effects or {}  # {"luck": 1.1, "defense": 5, etc}
 
 class PlayerInventory:
+    __slots__ = ("items", "coins", "xp", "level", "next_level_xp", "titles", "stats")
+
     def __init__(self):
         self.items = []
         self.coins = 0
         self.xp = 0
         self.level = 1
+        self.next_level_xp = self.level * 1000  # Simple progression, only changes on level up
         self.titles = []
         self.stats = {
             "items_found": 0,
@@ -129,17 +348,24 @@ class PlayerInventory:
         
     def add_xp(self, amount: int):
         self.xp += amount
-        while self.xp >= self.get_next_level_xp():
+        while self.xp >= self.next_level_xp:
             self.level_up()
             
     def level_up(self):
         self.level += 1
+        self.next_level_xp = self.level * 1000
         
     def get_next_level_xp(self):
-        return self.level * 1000  # Simple progression
+        return self.next_level_xp
 
 class Player:
     """Player object for storing game state"""
+    __slots__ = (
+        "user_id", "quest_name", "main_goal", "setting", "theme_style", "current_scene",
+        "current_scene_number", "total_scenes", "choice_history", "lives_remaining",
+        "max_lives", "inventory", "pending_scenes", "started_prefetches"
+    )
+
     def __init__(self):
         self.user_id = None
         self.quest_name = ""
@@ -153,6 +379,94 @@ class Player:
         self.lives_remaining = 3
         self.max_lives = 3
         self.inventory = PlayerInventory()
+        self.pending_scenes = {}  # (choice_text, success) -> asyncio.Task prefetching the next scene
+        self.started_prefetches = set()  # pending_scenes keys past the prefetch budget, i.e. actually requesting
+
+    def as_dict(self) -> Dict:
+        """Attribute snapshot for debug logging (slotted objects have no __dict__ for vars())"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+class ProgressSlot:
+    """Adventure generation progress for one user, updated in place and read by /status"""
+    __slots__ = ("status", "progress", "completed_scenes", "total_scenes", "time_remaining", "updated_at", "batch_id")
+
+    def __init__(self, total_scenes: int, time_remaining: int = 300):
+        self.status = "generating"
+        self.progress = 0.0
+        self.completed_scenes = 0
+        self.total_scenes = total_scenes
+        self.time_remaining = time_remaining
+        self.updated_at = time.monotonic()
+        self.batch_id = None  # Set while the adventure is queued through the Batch API
+
+    def update(self, status: str, progress: float, completed_scenes: int):
+        self.status = status
+        self.progress = progress
+        self.completed_scenes = completed_scenes
+        self.updated_at = time.monotonic()
+
+@dataclass(slots=True)
+class UserSession:
+    """Everything the game tracks for one user, kept in a single AdventureGame.sessions entry"""
+    gen_status: ProgressSlot
+    player: Optional[Player] = None  # Set once the adventure has been generated
+    channel_id: Optional[int] = None  # Where to announce a Batch API game once it's ready
+    rolls: List[Dict] = field(default_factory=list)
+    view: Optional[tuple] = None  # (scene_number, AdventureView) for the current scene
+
+# The quest name and opening description, in the order they appear in a streamed STRUCTURE_AND_OPENING_PROMPT
+# response - (key that starts the field, pattern matching the whole field once its value has closed)
+OPENING_PREVIEW_FIELDS = (
+    ('"quest_name"', re.compile(r'"quest_name"\s*:\s*"((?:[^"\\]|\\.)*)"')),
+    ('"opening_scene"', re.compile(r'"opening_scene"\s*:\s*\{\s*"description"\s*:\s*"((?:[^"\\]|\\.)*)"')),
+)
+
+# Story structure used when generation fails. Returned as-is, so callers can spot it by identity
+FALLBACK_STRUCTURE = {
+    "total_scenes": 5,
+    "quest_name": "Reality.exe Has Stopped Working",
+    "main_goal": "Debug the universe before the blue screen of death",
+    "setting": "The cosmic command prompt",
+    "theme_style": "Tech cosmic horror"
+}
+
+# (safe, risky) success rates indexed by scene number; index 0 is unused padding.
+# Make the game slightly easier with higher success rates
+SUCCESS_RATES = (
+    (75, 45),
+    (75, 45),  # First scene: very easy to encourage players
+    (70, 40),  # Second scene: still relatively easy
+    (65, 35),  # Third scene: medium difficulty
+    (60, 30),  # Fourth scene: challenging
+    (55, 25)   # Final scene: most challenging, but still doable
+)
+
+# Canned failure messages, matched against whole words in the failed choice
+CANNED_FAILURE_MESSAGES = tuple(
+    (re.compile(rf"\b(?:{'|'.join(keywords)})\b"), message)
+    for keywords, message in (
+        (("hack", "debug", "code", "reboot", "mainframe", "override"),
+         "The system logged your intrusion attempt and revoked your access to the rest of reality."),
+        (("negotiate", "convince", "persuade", "argue", "talk", "reason"),
+         "Your argument was flawless. Unfortunately, nobody was configured to listen."),
+        (("run", "escape", "flee", "hide", "sneak"),
+         "You ran. The problem had already calculated your exit route."),
+        (("attack", "fight", "destroy", "smash", "punch"),
+         "Brute force was attempted. The universe responded with more force."),
+        (("wait", "ignore", "observe", "nothing"),
+         "Inaction turned out to be an action, and a poor one."),
+    )
+)
+
+# Fixed processing messages shown while a choice resolves
+PROCESSING_MESSAGES = (
+    {"processing_message": "Working on it...", "result_title": "Processing"},
+    {"processing_message": "The story continues...", "result_title": "Next Chapter"},
+    {"processing_message": "Calculating consequences...", "result_title": "Thinking"},
+    {"processing_message": "Rewriting reality...", "result_title": "Please Wait"},
+    {"processing_message": "Consulting the void...", "result_title": "Loading"},
+    {"processing_message": "Spinning up new possibilities...", "result_title": "Creating"}
+)
 
 # ---- Adventure Game Core ----
 
@@ -162,75 +476,204 @@ class AdventureGame:
     def __init__(self):
         """Initialize the game state"""
         self.MAX_SCENES = 5  # Keep the standard 5 scenes
-        self.active_games = {}
-        self.roll_history = {}
-        self.generation_status = {}
+        self.sessions: Dict[int, UserSession] = {}
+        self.scene_cache = OrderedDict()  # prompt key hash -> generated scene, least recently used first
         
         # Maximum concurrent games
         self.MAX_CONCURRENT_GAMES = 5
+        self.SCENE_CACHE_SIZE = 1024
+        self.MAX_SESSIONS = 10_000  # Hard cap on tracked users, oldest evicted first
+        
+        # Ready-made (structure, opening scene) pairs so /start can skip generation
+        self.ADVENTURE_POOL_SIZE = int(os.getenv('ADVENTURE_POOL_SIZE', 3))
+        self.adventure_pool = asyncio.Queue(maxsize=max(self.ADVENTURE_POOL_SIZE, 1))
         
         logger.info("AdventureGame initialized")
     
     def get_scaled_success_rates(self, scene_number: int) -> tuple[int, int]:
         """Returns progressively harder success rates as game progresses"""
-        # Make the game slightly easier with higher success rates
-        base_rates = {
-            1: (75, 45),  # First scene: very easy to encourage players
-            2: (70, 40),  # Second scene: still relatively easy
-            3: (65, 35),  # Third scene: medium difficulty
-            4: (60, 30),  # Fourth scene: challenging
-            5: (55, 25)   # Final scene: most challenging, but still doable
-        }
-        return base_rates.get(scene_number, (55, 25))  # Default to hardest if scene number invalid
+        # Clamp into the table - anything past the final scene gets the hardest rates
+        return SUCCESS_RATES[min(max(scene_number, 1), len(SUCCESS_RATES) - 1)]
 
-    async def start_game(self, interaction: discord.Interaction) -> Player:
-        """Initialize a new game session"""
+    def clean_choices(self, scene: Dict, scene_number: int):
+        """Trim a generated scene to two choices with button-sized text, and pin their success rates
+        to the difficulty curve rather than whatever the model picked"""
+        scene["choices"] = scene["choices"][:2]
+        for choice, rate in zip(scene["choices"], self.get_scaled_success_rates(scene_number)):
+            if len(choice["text"]) > 80:
+                logger.warning("Choice too long, truncating: %s", choice["text"])
+                choice["text"] = choice["text"][:77] + "..."
+            choice["success_rate"] = rate
+
+    async def start_game(self, interaction: discord.Interaction,
+                         on_preview: Optional[Callable[[str, str], Awaitable[None]]] = None) -> Player:
+        """Initialize a new game session. on_preview(quest_name, description) is started as soon as
+        a live-generated opening scene's description has streamed in"""
         try:
             logger.info(f"=== STARTING NEW GAME ===")
             logger.info(f"Player: {interaction.user.name} (ID: {interaction.user.id})")
             
             # Log generation status
             logger.debug(f"Setting initial generation status")
-            self.generation_status[interaction.user.id] = {
-                'status': 'generating',
-                'progress': 0,
-                'completed_scenes': 0,
-                'total_scenes': self.MAX_SCENES,
-                'time_remaining': 300
-            }
+            progress = ProgressSlot(self.MAX_SCENES)
+            session = UserSession(gen_status=progress)
+            self.add_session(interaction.user.id, session)
             
-            # Log story generation
-            logger.info("Generating story structure...")
-            structure_response = await self.generate_story_structure()
-            logger.info(f"Story Structure: {json.dumps(structure_response, indent=2)}")
+            try:
+                structure_response, initial_scene = self.adventure_pool.get_nowait()
+                logger.info("Serving adventure from the pool (%d left)", self.adventure_pool.qsize())
+            except asyncio.QueueEmpty:
+                # Log story generation
+                logger.info("Generating story structure and opening scene...")
+                structure_response, initial_scene = await self.generate_structure_and_opening(on_preview)
+                logger.debug("Story Structure: %s", structure_response)
+                logger.debug("Initial Scene: %s", initial_scene)
             
-            # Log initial scene generation
-            logger.info("Generating initial scene...")
-            initial_scene = await self.generate_initial_scene(structure_response)
-            logger.info(f"Initial Scene: {json.dumps(initial_scene, indent=2)}")
-            
-            # Log player creation
-            logger.info("Creating new player object...")
-            player = Player()
-            player.user_id = interaction.user.id
-            player.quest_name = structure_response["quest_name"]
-            player.main_goal = structure_response["main_goal"]
-            player.setting = structure_response["setting"]
-            player.theme_style = structure_response["theme_style"]
-            player.current_scene = initial_scene
-            
-            logger.debug(f"New Player Object: {vars(player)}")
+            player = self.create_player(interaction.user.id, structure_response, initial_scene)
             
             # Log game state storage
             logger.info("Storing game state...")
-            self.active_games[interaction.user.id] = player
+            session.player = player
+            progress.update("complete", 100.0, 1)
+            self.prefetch_next_scenes(player)
             
             return player
             
         except Exception as e:
-            logger.error(f"Error in start_game: {str(e)}", exc_info=True)
+            logger.error("Error in start_game: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            session = self.sessions.get(interaction.user.id)
+            if session is not None:
+                session.gen_status.update("error", 0.0, 0)
             raise
 
+    def create_player(self, user_id: int, structure: Dict, initial_scene: Dict) -> Player:
+        """Build the player around a story structure and its opening scene"""
+        # Log player creation
+        logger.info("Creating new player object...")
+        player = Player()
+        player.user_id = user_id
+        player.quest_name = structure["quest_name"]
+        player.main_goal = structure["main_goal"]
+        player.setting = structure["setting"]
+        player.theme_style = structure["theme_style"]
+        player.current_scene = initial_scene
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("New Player Object: %s", player.as_dict())
+        return player
+
+    async def refill_adventure_pool(self):
+        """Keep adventure_pool topped up for the lifetime of the bot"""
+        while True:
+            try:
+                structure, initial_scene = await self.generate_structure_and_opening()
+                if structure is FALLBACK_STRUCTURE:
+                    # Don't stock the pool with the fallback quest while OpenAI is failing
+                    await asyncio.sleep(ADVENTURE_POOL_RETRY_DELAY)
+                    continue
+                # Blocks while the pool is full, so this only generates as adventures are used up
+                await self.adventure_pool.put((structure, initial_scene))
+            except Exception as e:
+                logger.error("Error refilling adventure pool: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+                await asyncio.sleep(ADVENTURE_POOL_RETRY_DELAY)
+
+    async def submit_batch(self, user_id: int, prompts: List[str], max_tokens: int) -> str:
+        """Queue prompts through the OpenAI Batch API and return the batch ID"""
+        lines = [
+            orjson.dumps({
+                "custom_id": f"{user_id}-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": "gpt-4o-mini",
+                    "messages": [{"role": "system", "content": prompt}],
+                    "response_format": {"type": "json_object"},
+                    "temperature": 0.8,
+                    "max_tokens": max_tokens,
+                    "top_p": OPENAI_TOP_P
+                }
+            })
+            for i, prompt in enumerate(prompts)
+        ]
+        batch_file = await openai_client.files.create(
+            file=(f"adventure-{user_id}.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+        batch = await openai_client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=BATCH_COMPLETION_WINDOW
+        )
+        logger.info("Submitted batch %s for user %s", batch.id, user_id)
+        return batch.id
+
+    async def start_batch_game(self, user_id: int, channel_id: int):
+        """Queue a new adventure through the Batch API - poll_batches finishes it once the batch completes"""
+        progress = ProgressSlot(self.MAX_SCENES)
+        self.add_session(user_id, UserSession(gen_status=progress, channel_id=channel_id))
+        try:
+            progress.batch_id = await self.submit_batch(
+                user_id, [STRUCTURE_AND_OPENING_PROMPT], STRUCTURE_AND_OPENING_MAX_TOKENS
+            )
+        except Exception:
+            progress.update("error", 0.0, 0)
+            raise
+        progress.update("batched", 0.0, 0)
+
+    async def poll_batches(self) -> List[int]:
+        """Check queued Batch API games and build the finished ones. Returns the user IDs that became ready"""
+        ready = []
+        # Snapshot - sessions can be added or dropped while we wait on OpenAI
+        for user_id, session in list(self.sessions.items()):
+            progress = session.gen_status
+            if progress.status != "batched":
+                continue
+            try:
+                batch = await openai_client.batches.retrieve(progress.batch_id)
+                if batch.status in ("failed", "expired", "cancelled") or (
+                        batch.status == "completed" and not batch.output_file_id):
+                    logger.error("Batch %s for user %s finished as %s", batch.id, user_id, batch.status)
+                    progress.update("error", 0.0, 0)
+                    continue
+                if batch.status != "completed":
+                    continue
+                
+                output = await openai_client.files.content(batch.output_file_id)
+            except Exception as e:
+                # Leave it queued and try again on the next poll
+                logger.error("Error polling batch %s: %s", progress.batch_id, e, exc_info=logger.isEnabledFor(logging.DEBUG))
+                continue
+            
+            if self.sessions.get(user_id) is not session:
+                # Ended with /end while we were waiting on OpenAI
+                continue
+            
+            try:
+                results = {}
+                for line in output.content.splitlines():
+                    result = orjson.loads(line)
+                    results[result["custom_id"]] = result
+                response = results[f"{user_id}-0"]["response"]["body"]
+                structure, initial_scene = self.parse_structure_and_opening(response["choices"][0]["message"]["content"])
+                session.player = self.create_player(user_id, structure, initial_scene)
+            except Exception as e:
+                # The output won't change, so re-reading it on the next poll can't help
+                logger.error("Unusable output from batch %s: %s", progress.batch_id, e, exc_info=logger.isEnabledFor(logging.DEBUG))
+                progress.update("error", 0.0, 0)
+                continue
+            progress.update("ready", 100.0, 1)
+            ready.append(user_id)
+        return ready
+
+    def take_ready_game(self, user_id: int) -> Optional[Player]:
+        """Hand over a game finished through the Batch API, or None if there isn't one waiting"""
+        session = self.sessions.get(user_id)
+        if session is None or session.gen_status.status != "ready":
+            return None
+        session.gen_status.update("complete", 100.0, 1)
+        self.prefetch_next_scenes(session.player)
+        return session.player
+
     async def create_game_embed(self, player: Player) -> discord.Embed:
         """Create the game embed with scene info"""
         # Create a more visually appealing embed with consistent colors
@@ -245,130 +688,255 @@ class AdventureGame:
         
         return embed
 
-    async def generate_next_scene(self, player: Player, previous_choice: str, success: bool, failure_message: str = None) -> Dict:
+    def create_preview_embed(self, quest_name: str, description: str) -> discord.Embed:
+        """Opening scene embed shown while the rest of a new game is still generating"""
+        embed = discord.Embed(
+            title=f"```{quest_name}```",
+            description=f"**Scene 1/{self.MAX_SCENES}:** {description}",
+            color=COLORS["PRIMARY"]
+        )
+        embed.set_footer(text="Preparing your choices...")
+        return embed
+
+    def prefetch_next_scenes(self, player: Player):
+        """Start generating the next scene for every choice and outcome of the current scene in the background"""
+        self.cancel_prefetch(player)
+        # The final scene ends the adventure either way, so there is nothing to prefetch
+        if player.current_scene_number >= self.MAX_SCENES:
+            return
+
+        for choice in player.current_scene["choices"]:
+            for success in (True, False):
+                # History as it will look once this choice has been made
+                choice_history = player.choice_history + [{
+                    'scene': player.current_scene_number,
+                    'choice': choice["text"],
+                    'outcome': 'success' if success else 'failure'
+                }]
+                if success:
+                    generate = functools.partial(self.generate_next_scene, player, choice["text"], success,
+                                                 choice_history=choice_history)
+                elif player.lives_remaining <= 1:
+                    # This failure ends the game, so the scene after it would never be shown
+                    generate = functools.partial(self.generate_failure_message, player, choice["text"], None,
+                                                 choice["success_rate"])
+                else:
+                    # Failure needs a failure message as well - fetch both in one request
+                    generate = functools.partial(self.generate_failure_and_next, player, choice["text"], None,
+                                                 choice["success_rate"], choice_history=choice_history)
+                key = (choice["text"], success)
+                player.pending_scenes[key] = asyncio.create_task(self.run_prefetch(player, key, generate))
+
+    async def run_prefetch(self, player: Player, key: tuple, generate: Callable[[], Awaitable]):
+        """Run a speculative generation once the prefetch budget has room, so prefetches can never
+        take every OpenAI slot from live requests"""
+        async with prefetch_semaphore:
+            player.started_prefetches.add(key)
+            return await generate()
+
+    def build_choice_context(self, choice_history: List[Dict]) -> str:
+        """Summarise the last few choices for scene prompts"""
+        parts = ["Previous choices:"]
+        if choice_history:
+            for choice in choice_history[-3:]:  # Last 3 choices for context
+                parts.append(CHOICE_LINE.format_map(choice))
+        else:
+            parts.append("This is the first choice in your adventure.")
+        parts.append("")  # Keep the trailing newline
+        return "\n".join(parts)
+
+    def cancel_prefetch(self, player: Player):
+        """Cancel any speculative scene generation still running for the player"""
+        for task in player.pending_scenes.values():
+            task.cancel()
+        player.pending_scenes.clear()
+        player.started_prefetches.clear()
+
+    async def generate_next_scene(self, player: Player, previous_choice: str, success: bool, failure_message: str = None,
+                                  choice_history: Optional[List[Dict]] = None) -> Dict:
         """Generate next scene that follows from previous events"""
         safe_rate, risky_rate = self.get_scaled_success_rates(player.current_scene_number + 1)
+        if choice_history is None:
+            choice_history = player.choice_history
+        
+        # Identical quest/choice/outcome combinations can reuse an earlier scene
+        cache_key = hashlib.blake2b(orjson.dumps(
+            [player.quest_name, player.main_goal, player.setting, previous_choice, success, player.current_scene_number + 1]
+        )).hexdigest()
+        cached_scene = self.scene_cache.get(cache_key)
+        if cached_scene is not None:
+            self.scene_cache.move_to_end(cache_key)
+            logger.info("Using cached scene %d", player.current_scene_number + 1)
+            return copy.deepcopy(cached_scene)
         
         # Build a choice history context for better continuity
-        choice_context = "Previous choices:\n"
-        if player.choice_history:
-            for i, choice in enumerate(player.choice_history[-3:]):  # Last 3 choices for context
-                choice_context += f"- Scene {choice['scene']}: {choice['choice']} ({choice['outcome']})\n"
-        else:
-            choice_context += "This is the first choice in your adventure.\n"
-        
-        scene_prompt = f"""Create the next scene for:
-        Quest: {player.quest_name}
-        Main Goal: {player.main_goal}
-        Setting: {player.setting}
-        Previous Choice: {previous_choice}
-        Success: {success}
-        Current Scene: {player.current_scene_number + 1}/{player.total_scenes}
-        {choice_context}
-
-        CRITICAL RULES:
-        1. Description MUST be ONE SHORT, DRY, WITTY sentence
-        2. Think Douglas Adams meets Portal's GLaDOS
-        3. NO flowery language or long descriptions
-        4. Choices must be under 80 chars and clever
-        5. IMPORTANT: ALL choices and descriptions MUST relate to {player.quest_name}
-        6. IMPORTANT: EVERY scene MUST advance the story toward {player.main_goal}
-        7. STICK TO THE THEME - no random new elements that weren't established
-        
-        Examples of GOOD descriptions:
-        - "The quantum AI has decided to become a stand-up comedian, and nobody has the heart to tell it it's not funny."
-        - "Turns out uploading consciousness to the cloud wasn't great for data storage costs."
-        - "The memes have unionized and are demanding better working conditions."
-        
-        Examples of BAD descriptions:
-        - Anything longer than one sentence
-        - Flowery or dramatic language
-        - Generic fantasy/sci-fi descriptions
-        - ANYTHING that doesn't directly relate to the established quest theme
-        
-        Return ONLY JSON:
-        {{
-            "description": "ONE short, witty sentence",
-            "choices": [
-                {{"text": "Clever choice (max 80 chars)", "success_rate": {safe_rate}}},
-                {{"text": "Witty risky choice (max 80 chars)", "success_rate": {risky_rate}}}
-            ]
-        }}"""
+        choice_context = self.build_choice_context(choice_history)
+        
+        scene_prompt = NEXT_SCENE_PROMPT.format(
+            quest_name=player.quest_name,
+            main_goal=player.main_goal,
+            setting=player.setting,
+            previous_choice=previous_choice,
+            success=success,
+            scene_number=player.current_scene_number + 1,
+            total_scenes=player.total_scenes,
+            choice_context=choice_context,
+            safe_rate=safe_rate,
+            risky_rate=risky_rate
+        )
 
         try:
-            logger.info(f"=== GENERATING SCENE {player.current_scene_number + 1} ===")
-            logger.info(f"Previous choice: {previous_choice}")
-            logger.info(f"Success: {success}")
-            logger.info(f"Failure message: {failure_message}")
-            logger.info(f"Scene prompt:\n{scene_prompt}")
+            logger.info("=== GENERATING SCENE %d ===", player.current_scene_number + 1)
+            logger.info("Previous choice: %s", previous_choice)
+            logger.info("Success: %s", success)
+            logger.info("Failure message: %s", failure_message)
+            logger.debug("Scene prompt:\n%s", scene_prompt)
             
-            response = openai_client.chat.completions.create(
+            content = await create_chat_completion(
                 model="gpt-4o-mini",
-                messages=[{"role": "system", "content": scene_prompt}],
+                messages=[
+                    {"role": "system", "content": SCENE_SYSTEM},
+                    {"role": "user", "content": scene_prompt}
+                ],
                 response_format={"type": "json_object"},
-                temperature=0.8
+                temperature=0.8,
+                max_tokens=SCENE_MAX_TOKENS,
+                top_p=OPENAI_TOP_P
             )
             
-            scene_data = json.loads(response.choices[0].message.content)
-            logger.info(f"Generated scene data: {json.dumps(scene_data, indent=2)}")
+            scene_data = orjson.loads(content)
+            logger.debug("Generated scene data: %s", scene_data)
             
-            # Validate choice lengths
-            for choice in scene_data["choices"]:
-                if len(choice["text"]) > 80:
-                    logger.warning(f"Choice too long, truncating: {choice['text']}")
-                    choice["text"] = choice["text"][:77] + "..."
+            self.clean_choices(scene_data, player.current_scene_number + 1)
+            
+            # Whether this scene follows a successful roll - used by StoryRepository
+            scene_data["is_success"] = success
+            
+            self.scene_cache[cache_key] = copy.deepcopy(scene_data)
+            if len(self.scene_cache) > self.SCENE_CACHE_SIZE:
+                self.scene_cache.popitem(last=False)
             
             return scene_data
 
         except Exception as e:
-            logger.error(f"Error generating scene: {str(e)}", exc_info=True)
-            return {
-                "description": "The universe blue-screened. No pressure.",
-                "choices": [
-                    {"text": "Try turning it off and on again", "success_rate": safe_rate},
-                    {"text": "Hack the mainframe", "success_rate": risky_rate}
-                ]
-            }
+            logger.error("Error generating scene: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            return self.get_fallback_scene(player)
 
-    async def generate_failure_message(self, player: Player, choice_text: str, roll: int, required: int) -> Dict:
-        """Generate a contextual failure message"""
-        prompt = f"""Write a SHORT, contextual failure message.
-            Scene: {player.current_scene['description']}
-            Failed Action: {choice_text}
-            Roll: {roll} (needed {required} or less)
+    def get_fallback_scene(self, player: Player) -> Dict:
+        """Scene to show when the next scene can't be generated"""
+        safe_rate, risky_rate = self.get_scaled_success_rates(player.current_scene_number + 1)
+        return {
+            "description": "The universe blue-screened. No pressure.",
+            "choices": [
+                {"text": "Try turning it off and on again", "success_rate": safe_rate},
+                {"text": "Hack the mainframe", "success_rate": risky_rate}
+            ]
+        }
 
-            CRITICAL RULES:
-            1. Keep it short (1-2 sentences)
-            2. Message MUST directly relate to the scene and action
-            3. Maintain the serious sci-fi/tech tone
-            4. NO random elements unrelated to the scene
-            5. NO silly memes or internet references
+    def get_canned_failure(self, choice_text: str) -> Optional[str]:
+        """Fixed failure message for the action, if one fits - saves a round-trip for flavour text"""
+        lowered_choice = choice_text.lower()
+        for pattern, message in CANNED_FAILURE_MESSAGES:
+            if pattern.search(lowered_choice):
+                return message
+        return None
 
-            Return ONLY JSON:
-            {{
-                "message": "Short, contextual failure message"
-            }}"""
+    async def generate_failure_message(self, player: Player, choice_text: str, roll: Optional[int], required: int) -> Dict:
+        """Generate a contextual failure message"""
+        message = self.get_canned_failure(choice_text)
+        if message is not None:
+            return {"message": message}
+        
+        # The roll isn't known yet when this is prefetched
+        roll_text = f"{roll} (needed {required} or less)" if roll is not None else f"over {required}"
+        prompt = FAILURE_PROMPT.format(
+            scene=player.current_scene['description'],
+            choice_text=choice_text,
+            roll_text=roll_text
+        )
 
         try:
-            response = openai_client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "system", "content": prompt}],
+            content = await create_chat_completion(
+                model=FLAVOR_MODEL,
+                messages=[
+                    {"role": "system", "content": FAILURE_SYSTEM},
+                    {"role": "user", "content": prompt}
+                ],
                 response_format={"type": "json_object"},
-                temperature=0.7
+                temperature=0.7,
+                max_tokens=FAILURE_MAX_TOKENS,
+                top_p=OPENAI_TOP_P
             )
             
-            return json.loads(response.choices[0].message.content)
+            return orjson.loads(content)
         except Exception as e:
-            logger.error(f"Error generating failure message: {e}")
+            logger.error("Error generating failure message: %s", e)
             return {"message": "The attempt failed. Try a different approach."}
 
+    async def generate_failure_and_next(self, player: Player, choice_text: str, roll: Optional[int], required: int,
+                                        choice_history: Optional[List[Dict]] = None) -> tuple[Dict, Dict]:
+        """Generate the failure message and the scene that follows it in a single request"""
+        if choice_history is None:
+            choice_history = player.choice_history
+        
+        # With a canned message only the scene needs generating
+        message = self.get_canned_failure(choice_text)
+        if message is not None:
+            scene_data = await self.generate_next_scene(player, choice_text, False, message, choice_history=choice_history)
+            return {"message": message}, scene_data
+        
+        safe_rate, risky_rate = self.get_scaled_success_rates(player.current_scene_number + 1)
+        choice_context = self.build_choice_context(choice_history)
+        # The roll isn't known yet when this is prefetched
+        roll_text = f"{roll} (needed {required} or less)" if roll is not None else f"over {required}"
+
+        prompt = FAILURE_AND_NEXT_PROMPT.format(
+            quest_name=player.quest_name,
+            main_goal=player.main_goal,
+            setting=player.setting,
+            scene=player.current_scene['description'],
+            choice_text=choice_text,
+            roll_text=roll_text,
+            scene_number=player.current_scene_number + 1,
+            total_scenes=player.total_scenes,
+            choice_context=choice_context,
+            safe_rate=safe_rate,
+            risky_rate=risky_rate
+        )
+
+        try:
+            content = await create_chat_completion(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": FAILURE_AND_NEXT_SYSTEM},
+                    {"role": "user", "content": prompt}
+                ],
+                response_format={"type": "json_object"},
+                temperature=0.8,
+                max_tokens=FAILURE_AND_NEXT_MAX_TOKENS,
+                top_p=OPENAI_TOP_P
+            )
+
+            data = orjson.loads(content)
+            scene_data = data["next_scene"]
+            scene_data["is_success"] = False
+            self.clean_choices(scene_data, player.current_scene_number + 1)
+
+            return {"message": data["failure_message"]}, scene_data
+
+        except Exception as e:
+            logger.error("Error generating failure and next scene: %s", e)
+            return {"message": "The attempt failed. Try a different approach."}, self.get_fallback_scene(player)
+
     async def generate_victory_scene(self, player: Player, final_choice: str, success: bool) -> Dict:
         """Generate a victory scene based on the player's journey"""
         
         # Build a more detailed narrative of the player's journey
-        choice_narrative = "Player's journey:\n"
+        parts = ["Player's journey:"]
         for choice in player.choice_history:
-            choice_narrative += f"- Scene {choice['scene']}: {choice['choice']} ({choice['outcome']})\n"
+            parts.append(CHOICE_LINE.format_map(choice))
+        parts.append("")  # Keep the trailing newline
+        choice_narrative = "\n".join(parts)
         
         # Include information about lives lost
         lives_lost = player.max_lives - player.lives_remaining
@@ -376,43 +944,34 @@ class AdventureGame:
         if lives_lost > 0:
             life_status += f" You faced {lives_lost} major setback(s) along the way."
         
-        prompt = f"""Create a victory scene for:
-        Quest: {player.quest_name}
-        Main Goal: {player.main_goal}
-        Setting: {player.setting}
-        Theme: {player.theme_style}
-        Final Choice: {final_choice}
-        Success: {success}
-        Lives Remaining: {player.lives_remaining}/{player.max_lives}
-        
-        {choice_narrative}
-        
-        Create a self-aware, witty conclusion that references:
-        1. The player's specific choices throughout their journey
-        2. Any failures or setbacks they encountered
-        3. The main quest objective and how it was resolved
-        4. Be Douglas Adams meets Portal's GLaDOS in tone (dry humor)
-        
-        Return ONLY JSON:
-        {{
-            "title": "A clever, punchy victory title",
-            "description": "2-3 sentences describing the victory that references specific player choices",
-            "quest_status": "One line final status with dry humor",
-            "reward": "Unique reward that fits the story and player's journey",
-            "epilogue": "A single funny line about what happens after the adventure"
-        }}"""
+        prompt = VICTORY_PROMPT.format(
+            quest_name=player.quest_name,
+            main_goal=player.main_goal,
+            setting=player.setting,
+            theme_style=player.theme_style,
+            final_choice=final_choice,
+            success=success,
+            lives_remaining=player.lives_remaining,
+            max_lives=player.max_lives,
+            choice_narrative=choice_narrative
+        )
         
         try:
-            response = openai_client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "system", "content": prompt}],
+            content = await create_chat_completion(
+                model=FLAVOR_MODEL,
+                messages=[
+                    {"role": "system", "content": VICTORY_SYSTEM},
+                    {"role": "user", "content": prompt}
+                ],
                 response_format={"type": "json_object"},
-                temperature=0.7
+                temperature=0.7,
+                max_tokens=VICTORY_MAX_TOKENS,
+                top_p=OPENAI_TOP_P
             )
             
-            return json.loads(response.choices[0].message.content)
+            return orjson.loads(content)
         except Exception as e:
-            logger.error(f"Error generating victory scene: {e}")
+            logger.error("Error generating victory scene: %s", e)
             return {
                 "title": "Mission Accomplished... Probably",
                 "description": "You completed your quest successfully, though the universe seems mildly surprised.",
@@ -424,25 +983,18 @@ class AdventureGame:
     async def generate_processing_message(self, choice: str) -> dict:
         """Generate a processing message"""
         # Use simpler, fixed processing messages instead of generating them
-        processing_messages = [
-            {"processing_message": "Working on it...", "result_title": "Processing"},
-            {"processing_message": "The story continues...", "result_title": "Next Chapter"},
-            {"processing_message": "Calculating consequences...", "result_title": "Thinking"},
-            {"processing_message": "Rewriting reality...", "result_title": "Please Wait"},
-            {"processing_message": "Consulting the void...", "result_title": "Loading"},
-            {"processing_message": "Spinning up new possibilities...", "result_title": "Creating"}
-        ]
-        
-        # Choose a random processing message
-        return random.choice(processing_messages)
+        return random.choice(PROCESSING_MESSAGES)
 
     async def handle_game_over(self, interaction: discord.Interaction, player: Player, failure_message: str):
         """Handle game over state"""
+        session = self.sessions.get(interaction.user.id)
         try:
+            rolls = session.rolls if session is not None else []
+            
             # Log roll history before cleanup
-            if interaction.user.id in self.roll_history:
+            if rolls:
                 logger.info(f"Final roll history for user {interaction.user.id}:")
-                for roll_data in self.roll_history[interaction.user.id]:
+                for roll_data in rolls:
                     logger.info(f"  Scene {roll_data['scene']}: Roll {roll_data['roll']} (needed {roll_data['required']}) - {roll_data['choice']}")
             
             game_over_embed = discord.Embed(
@@ -452,10 +1004,10 @@ class AdventureGame:
             )
             
             # Add roll history to embed
-            if interaction.user.id in self.roll_history:
+            if rolls:
                 rolls_text = "\n".join([
                     f"Scene {r['scene']}: {r['roll']} vs {r['required']} - {r['choice']}"
-                    for r in self.roll_history[interaction.user.id]
+                    for r in rolls
                 ])
                 game_over_embed.add_field(
                     name="Roll History",
@@ -471,36 +1023,22 @@ class AdventureGame:
                 inline=False
             )
             
-            await interaction.edit_original_response(
-                embed=game_over_embed,
-                view=None
-            )
-            
-            # Clean up game state
-            if interaction.user.id in self.active_games:
-                del self.active_games[interaction.user.id]
-            if interaction.user.id in self.generation_status:
-                del self.generation_status[interaction.user.id]
-            if interaction.user.id in self.roll_history:
-                del self.roll_history[interaction.user.id]
-            
-            # End the session
-            session_manager.end_session(interaction.user.id)
+            await self.update_view(interaction, game_over_embed, view=None)
             
         except Exception as e:
-            logger.error(f"Error in handle_game_over: {e}")
-            # Ensure cleanup even on error
-            if interaction.user.id in self.active_games:
-                del self.active_games[interaction.user.id]
-            if interaction.user.id in self.generation_status:
-                del self.generation_status[interaction.user.id]
-            if interaction.user.id in self.roll_history:
-                del self.roll_history[interaction.user.id]
-            session_manager.end_session(interaction.user.id)
+            logger.error("Error in handle_game_over: %s", e)
+        finally:
+            # Clean up game state and end the session, even on error - unless a new game has replaced it
+            if self.sessions.get(interaction.user.id) is session:
+                self.cleanup_user(interaction.user.id)
 
     async def process_choice(self, interaction: discord.Interaction, choice_text: str, success_rate: int):
         """Process player choice and determine outcome"""
-        player = self.active_games[interaction.user.id]
+        user_id = interaction.user.id
+        session = self.sessions.get(user_id)
+        if session is None or session.player is None:
+            return
+        player = session.player
         
         # Roll for success
         if hasattr(self, 'TEST_MODE') and self.TEST_MODE:
@@ -510,12 +1048,16 @@ class AdventureGame:
             roll = random.randint(1, 100)
             success = roll <= success_rate
         
-        # Initialize roll history if needed
-        if interaction.user.id not in self.roll_history:
-            self.roll_history[interaction.user.id] = []
+        # Keep the prefetched scene for the outcome that happened and drop the rest
+        next_scene_task = player.pending_scenes.pop((choice_text, success), None)
+        if next_scene_task is not None and (choice_text, success) not in player.started_prefetches:
+            # Still queued behind other prefetches - it's needed now, so request it live below instead
+            next_scene_task.cancel()
+            next_scene_task = None
+        self.cancel_prefetch(player)
         
         # Record the roll
-        self.roll_history[interaction.user.id].append({
+        session.rolls.append({
             'scene': player.current_scene_number,
             'roll': roll,
             'required': success_rate,
@@ -530,6 +1072,25 @@ class AdventureGame:
             'roll': roll
         })
         
+        failure_task = None
+        if not success and player.lives_remaining <= 1:
+            # This failure ends the game, only the message is needed - which is all that was prefetched for it
+            failure_task = next_scene_task or asyncio.create_task(
+                self.generate_failure_message(player, choice_text, roll, success_rate)
+            )
+            next_scene_task = None
+        elif next_scene_task is None:
+            # Nothing prefetched for this outcome (e.g. on the final scene) - start generating now
+            # so the request overlaps the pause while the player reads the roll
+            if not success:
+                next_scene_task = asyncio.create_task(
+                    self.generate_failure_and_next(player, choice_text, roll, success_rate)
+                )
+            elif player.current_scene_number < self.MAX_SCENES:
+                next_scene_task = asyncio.create_task(
+                    self.generate_next_scene(player, choice_text, success)
+                )
+        
         logger.info(f"==== PROCESSING CHOICE ====")
         logger.info(f"Roll: {roll} vs needed {success_rate}")
         
@@ -542,13 +1103,28 @@ class AdventureGame:
             color=COLORS["SUCCESS"] if success else COLORS["DANGER"]
         )
         
-        await interaction.edit_original_response(embed=roll_embed)
+        # First edit of the choice - acknowledges the button press and shows the disabled buttons in one call
+        await self.update_view(interaction, roll_embed, view=self.get_view(player))
         await asyncio.sleep(3.5)  # Give players time to see the result
         
+        # The session can be ended (/end, expiry, eviction) or replaced by a new /start during any
+        # of the awaits below - stop touching it once that happens
+        if self.sessions.get(user_id) is not session:
+            for task in (next_scene_task, failure_task):
+                if task is not None:
+                    task.cancel()
+            return
+        
         # Handle failed roll
+        next_scene = None
         if not success:
             player.lives_remaining -= 1
-            failure_data = await self.generate_failure_message(player, choice_text, roll, success_rate)
+            if next_scene_task is not None:
+                failure_data, next_scene = await next_scene_task
+            else:
+                failure_data = await failure_task
+            if self.sessions.get(user_id) is not session:
+                return
             
             if player.lives_remaining <= 0:
                 # Game over - no lives left
@@ -566,8 +1142,12 @@ class AdventureGame:
                 value=f"{'❤️' * player.lives_remaining}{'🖤' * (player.max_lives - player.lives_remaining)}",
                 inline=False
             )
-            await interaction.edit_original_response(embed=life_loss_embed, view=None)
+            await self.update_view(interaction, life_loss_embed, view=None)
             await asyncio.sleep(4)
+            if self.sessions.get(user_id) is not session:
+                if next_scene_task is not None:
+                    next_scene_task.cancel()
+                return
         
         # Check for victory condition - if this is the final scene and the roll succeeded
         if success and player.current_scene_number == self.MAX_SCENES:
@@ -576,18 +1156,17 @@ class AdventureGame:
             return
         
         # Continue to next scene
-        logger.debug(f"Full Game State Pre-Choice:")
-        logger.debug(f"Player Object: {vars(player)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Full Game State Pre-Choice:")
+            logger.debug("Player Object: %s", player.as_dict())
         
         # Generate next scene
-        logger.info("=== GENERATING NEXT SCENE ===")
-        next_scene = await self.generate_next_scene(
-            player,
-            choice_text,
-            success,
-            failure_data["message"] if not success else None
-        )
-        logger.info(f"Next Scene Generated: {json.dumps(next_scene, indent=2)}")
+        if next_scene is None:
+            logger.info("=== WAITING FOR NEXT SCENE ===")
+            next_scene = await next_scene_task
+            if self.sessions.get(user_id) is not session:
+                return
+        logger.info("Next Scene Generated: %s", next_scene)
         
         # Update player's scene
         player.current_scene = next_scene
@@ -601,15 +1180,20 @@ class AdventureGame:
         
         # Show the new scene
         new_embed = await self.create_game_embed(player)
-        new_view = AdventureView(self, player)
-        await interaction.edit_original_response(embed=new_embed, view=new_view)
+        new_view = self.get_view(player)
+        await self.update_view(interaction, new_embed, view=new_view)
+        if self.sessions.get(user_id) is not session:
+            return
+        self.prefetch_next_scenes(player)
         
         # Log game state after processing
-        logger.debug(f"Full Game State Post-Choice:")
-        logger.debug(f"Player Object: {vars(player)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Full Game State Post-Choice:")
+            logger.debug("Player Object: %s", player.as_dict())
 
     async def handle_victory(self, interaction: discord.Interaction, player: Player, final_choice: str):
         """Handle player victory"""
+        session = self.sessions.get(interaction.user.id)
         try:
             logger.info("=== VICTORY CONDITION MET ===")
             
@@ -659,151 +1243,142 @@ class AdventureGame:
                 inline=False
             )
             
-            await interaction.edit_original_response(
-                embed=embed,
-                view=None
-            )
-            
-            # Clean up game state
-            if interaction.user.id in self.active_games:
-                del self.active_games[interaction.user.id]
-            if interaction.user.id in self.generation_status:
-                del self.generation_status[interaction.user.id]
+            await self.update_view(interaction, embed, view=None)
             
         except Exception as e:
-            logger.error(f"Error in handle_victory: {e}")
-            # Still try to clean up game state on error
-            if interaction.user.id in self.active_games:
-                del self.active_games[interaction.user.id]
-            if interaction.user.id in self.generation_status:
-                del self.generation_status[interaction.user.id]
-
-    async def generate_story_structure(self) -> Dict:
-        """Generate the initial story structure"""
-        try:
-            logger.info("Generating story structure...")
-            
-            structure_prompt = """Create a COMPLETELY UNEXPECTED adventure scenario.
+            logger.error("Error in handle_victory: %s", e)
+        finally:
+            # Clean up game state and end the session, even on error - unless a new game has replaced it
+            if self.sessions.get(interaction.user.id) is session:
+                self.cleanup_user(interaction.user.id)
 
-            ABSOLUTELY BANNED TOPICS:
-            - NO food, cooking, restaurants, or eating
-            - NO service industry or customer service
-            - NO generic "save the world" plots
-            - NO standard fantasy/sci-fi tropes
-            - NO basic AI gone rogue stories
-            
-            Think WILD situations like:
-            - A bureaucratic war between parallel universes over who owns the color blue
-            - Debugging a social network where memes have gained sentience and started a cult
-            - Fixing a glitch where corporate buzzwords physically manifest as eldritch horrors
-            - Managing a crisis where everyone's dreams got converted into cryptocurrency
-            - Resolving a dispute between time travelers and their future selves over playlist rights
-            - Preventing quantum physics from becoming self-aware and filing for personhood
-            - Dealing with a reality where puns have become weapons of mass destruction
-            
-            CRITICAL RULES:
-            1. Must combine UNRELATED concepts in mind-bending ways
-            2. Should be both absurd AND logical within its own rules
-            3. Must make players think "I can't believe this makes sense"
-            4. Dark humor and existential comedy encouraged
-            5. Should feel like a Douglas Adams plot on acid
-            
-            Return ONLY JSON:
-            {
-                "total_scenes": 5,
-                "quest_name": "Title that makes you do a double-take",
-                "main_goal": "Objective that sounds insane but follows dream logic",
-                "setting": "Location that defies normal space-time",
-                "theme_style": "Two conflicting concepts forced together"
-            }"""
-
-            response = openai_client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "system", "content": structure_prompt}],
-                response_format={"type": "json_object"},
-                temperature=0.8
-            )
-            
-            structure_data = json.loads(response.choices[0].message.content)
-            logger.info(f"Generated story structure: {json.dumps(structure_data, indent=2)}")
-            return structure_data
+    def parse_structure_and_opening(self, content: str) -> tuple[Dict, Dict]:
+        """Split a STRUCTURE_AND_OPENING_PROMPT response into the story structure and opening scene"""
+        data = orjson.loads(content)
+        structure_data = data["structure"]
+        scene_data = data["opening_scene"]
+        self.clean_choices(scene_data, 1)
+        
+        return structure_data, scene_data
 
-        except Exception as e:
-            logger.error(f"Error generating story structure: {str(e)}", exc_info=True)
-            # Fallback structure if generation fails
-            return {
-                "total_scenes": 5,
-                "quest_name": "Reality.exe Has Stopped Working",
-                "main_goal": "Debug the universe before the blue screen of death",
-                "setting": "The cosmic command prompt",
-                "theme_style": "Tech cosmic horror"
-            }
+    async def generate_structure_and_opening(
+            self, on_preview: Optional[Callable[[str, str], Awaitable[None]]] = None) -> tuple[Dict, Dict]:
+        """Generate the story structure and its opening scene in a single request"""
+        on_text = None
+        preview_task = None
+        if on_preview is not None:
+            async def show_preview(quest_name: str, description: str):
+                try:
+                    await on_preview(quest_name, description)
+                except Exception as e:
+                    logger.error("Error showing opening preview: %s", e)
 
-    async def generate_initial_scene(self, structure: Dict) -> Dict:
-        """Generate the first scene based on story structure"""
-        scene_prompt = f"""Create opening scene for:
-        Quest: {structure['quest_name']}
-        
-        CRITICAL RULES:
-        1. Description MUST be ONE SHORT, DRY, WITTY sentence
-        2. Think Douglas Adams meets Portal's GLaDOS
-        3. NO flowery language or long descriptions
-        4. Choices must be under 80 chars and clever
-        
-        Examples of GOOD descriptions:
-        - "The simulation's warranty expired, and reality is showing pop-up ads."
-        - "Someone taught AI about existential dread, and now it won't stop posting on Reddit."
-        
-        Return ONLY JSON:
-        {{
-            "description": "ONE short, witty sentence",
-            "choices": [
-                {{"text": "Clever but safe choice", "success_rate": 70}},
-                {{"text": "Witty but risky choice", "success_rate": 40}}
-            ]
-        }}"""
+            found = []
+            scan_from = 0
 
-        logger.info(f"=== GENERATING INITIAL SCENE ===")
-        logger.info(f"Structure: {json.dumps(structure, indent=2)}")
-        logger.info(f"Scene prompt:\n{scene_prompt}")
+            def on_text(text: str, offset: int) -> bool:
+                # The description comes before the choices, so it can be shown while they're still decoding.
+                # Only text past scan_from is searched, and returning True stops the calls once it's been shown
+                nonlocal preview_task, scan_from
+                if offset == 0:
+                    # A retried request streams from the start again
+                    found.clear()
+                    scan_from = 0
+                while len(found) < len(OPENING_PREVIEW_FIELDS):
+                    key, pattern = OPENING_PREVIEW_FIELDS[len(found)]
+                    match = pattern.search(text, scan_from)
+                    if match is None:
+                        # Resume from the latest key, whose value may still be streaming,
+                        # or from the tail in case the key itself has only partly arrived
+                        start = text.rfind(key, scan_from)
+                        scan_from = start if start != -1 else max(scan_from, len(text) - len(key) + 1)
+                        return False
+                    found.append(match[1])
+                    scan_from = match.end()
+                
+                try:
+                    quest_name, description = orjson.loads(f'["{found[0]}", "{found[1]}"]')
+                except orjson.JSONDecodeError as e:
+                    logger.error("Error decoding opening preview: %s", e)
+                    return True
+                # Runs alongside the stream instead of holding up reading it
+                preview_task = asyncio.create_task(show_preview(quest_name, description))
+                return True
 
         try:
-            response = openai_client.chat.completions.create(
+            logger.info("Generating story structure and opening scene...")
+            
+            content = await create_chat_completion(
+                on_text=on_text,
                 model="gpt-4o-mini",
-                messages=[{"role": "system", "content": scene_prompt}],
+                messages=[{"role": "system", "content": STRUCTURE_AND_OPENING_PROMPT}],
                 response_format={"type": "json_object"},
-                temperature=0.8
+                temperature=0.8,
+                max_tokens=STRUCTURE_AND_OPENING_MAX_TOKENS,
+                top_p=OPENAI_TOP_P
             )
             
-            scene_data = json.loads(response.choices[0].message.content)
-            logger.info(f"Generated initial scene: {json.dumps(scene_data, indent=2)}")
-            
-            # Validate choice lengths
-            for choice in scene_data["choices"]:
-                if len(choice["text"]) > 80:
-                    choice["text"] = choice["text"][:77] + "..."
-            
-            return scene_data
+            structure_data, scene_data = self.parse_structure_and_opening(content)
+            return structure_data, scene_data
 
         except Exception as e:
-            logger.error(f"Error generating initial scene: {str(e)}", exc_info=True)
-            return {
+            logger.error("Error generating story structure and opening scene: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            # Fallback adventure if generation fails
+            return FALLBACK_STRUCTURE, {
                 "description": "Reality glitches around you, presenting two paths forward.",
                 "choices": [
                     {"text": "Debug the mainframe", "success_rate": 70},
                     {"text": "Hack the gibson", "success_rate": 40}
                 ]
             }
+        finally:
+            # Let the preview land before the caller draws the full game over it
+            if preview_task is not None:
+                await preview_task
+
+    async def update_view(self, interaction: discord.Interaction, embed: discord.Embed,
+                          view: Optional[discord.ui.View] = discord.utils.MISSING):
+        """Show a game state change by editing the game message in place.
+        Uses the interaction response if it hasn't been sent yet, so the edit doubles as the acknowledgement"""
+        if interaction.response.is_done():
+            await interaction.edit_original_response(embed=embed, view=view)
+        else:
+            await interaction.response.edit_message(embed=embed, view=view)
+
+    def get_view(self, player: Player) -> "AdventureView":
+        """Get the choice view for the player's current scene, only rebuilding it when the scene changes"""
+        session = self.sessions.get(player.user_id)
+        if session is None or session.player is not player:
+            # The game was ended or replaced while it was being drawn - don't cache onto another session
+            return AdventureView(self, player)
+        if session.view is None or session.view[0] != player.current_scene_number:
+            session.view = (player.current_scene_number, AdventureView(self, player))
+        return session.view[1]
+
+    def add_session(self, user_id: int, session: UserSession):
+        """Track a new session for a user, evicting the longest-tracked users past MAX_SESSIONS"""
+        # Re-inserting moves the user to the back of the dict's insertion order
+        self.cancel_background_generation(self.sessions.pop(user_id, None))
+        self.sessions[user_id] = session
+        while len(self.sessions) > self.MAX_SESSIONS:
+            oldest_user_id = next(iter(self.sessions))
+            logger.warning("Session limit reached, evicting user %s", oldest_user_id)
+            self.cleanup_user(oldest_user_id)
+
+    def cancel_background_generation(self, session: Optional[UserSession]):
+        """Stop any generation still running for a session that's being dropped"""
+        if session is not None and session.player is not None:
+            self.cancel_prefetch(session.player)
+
+    def cleanup_user(self, user_id: int):
+        """Drop all game state for a user and end their session"""
+        self.cancel_background_generation(self.sessions.pop(user_id, None))
+        session_manager.end_session(user_id)
 
     def get_player(self, user_id: int) -> Optional[Player]:
         """Get a player by their user ID"""
-        try:
-            if user_id in self.active_games:
-                return self.active_games[user_id]
-            return None
-        except Exception as e:
-            logger.error(f"Error in get_player: {str(e)}", exc_info=True)
-            return None
+        session = self.sessions.get(user_id)
+        return session.player if session is not None else None
 
 # ---- Discord UI and Bot Commands ----
 
@@ -821,7 +1396,8 @@ class AdventureView(discord.ui.View):
             button = discord.ui.Button(
                 style=discord.ButtonStyle.secondary,  # Gray for all buttons
                 label=choice["text"],
-                custom_id=f"choice_{i}_{uuid.uuid4()}"
+                # Views are dispatched per message, so this only has to be unique within the view
+                custom_id=f"c{i}s{player.current_scene_number}"
             )
             
             # Add callback for this specific button
@@ -843,10 +1419,7 @@ class AdventureView(discord.ui.View):
                         # Keep other buttons gray but disabled
                         item.style = discord.ButtonStyle.secondary
             
-            # Update the message to show disabled buttons with selection highlighted
-            await interaction.response.edit_message(view=self)
-            
-            # Now process the choice
+            # process_choice shows the disabled buttons along with the roll in a single edit
             await self.game.process_choice(interaction, choice_text, success_rate)
             
         return callback
@@ -880,95 +1453,289 @@ class MyClient(discord.Client):
         intents.message_content = True
         super().__init__(intents=intents)
         self.tree = app_commands.CommandTree(self)
+        self.cleanup_task: Optional[asyncio.Task] = None
+        self.pool_task: Optional[asyncio.Task] = None
 
     async def setup_hook(self):
         await self.tree.sync()
+        # Start the periodic session cleanup task
+        self.cleanup_task = asyncio.create_task(cleanup_forever())
+        if game.ADVENTURE_POOL_SIZE > 0:
+            self.pool_task = asyncio.create_task(game.refill_adventure_pool())
+
+    async def close(self):
+        if self.cleanup_task:
+            self.cleanup_task.cancel()
+        if self.pool_task:
+            self.pool_task.cancel()
+        await openai_client.close()
+        await super().close()
         
     async def on_ready(self):
         await self.change_presence(activity=discord.Game(name="/help"))
         print(f'Logged in as {self.user} (ID: {self.user.id})')
         print('------')
         await self.tree.sync()  # Move sync here
-        # Start the periodic session cleanup task
-        cleanup_sessions.start()
 
 # Initialize instances after all classes are defined
 client = MyClient()
 game = AdventureGame()
-openai_client = OpenAI()
+# One client for the whole bot so every request reuses the same pooled keep-alive connections.
+# Retries are handled by create_chat_completion, so the SDK's own retries are turned off.
+# HTTP/2 multiplexes concurrent completions over one connection; httpx needs the h2 package for it.
+openai_client = AsyncOpenAI(
+    api_key=os.getenv('OPENAI_API_KEY'),
+    max_retries=0,
+    http_client=DefaultAsyncHttpxClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+    )
+)
 
-@client.tree.command(name="start", description="Start a new adventure")
-async def start(interaction: discord.Interaction):
-    try:
-        # Create a session first
-        success, message = session_manager.create_session(interaction.user.id, interaction.channel_id)
-        if not success:
-            await interaction.response.send_message(message, ephemeral=True)
-            return
+OPENAI_MAX_ATTEMPTS = 5
+OPENAI_MAX_RETRY_DELAY = 60  # seconds
+BATCH_COMPLETION_WINDOW = "24h"  # Only window the Batch API accepts
+ADVENTURE_POOL_RETRY_DELAY = 60  # seconds to wait before refilling again after a failure
+# Output caps per request. Responses are small, schema-bounded JSON, so these sit well above
+# the usual length and only cut off a runaway generation
+SCENE_MAX_TOKENS = 320
+FAILURE_MAX_TOKENS = 120
+FAILURE_AND_NEXT_MAX_TOKENS = 400
+VICTORY_MAX_TOKENS = 400
+STRUCTURE_AND_OPENING_MAX_TOKENS = 450
+OPENAI_TOP_P = 0.9
+# Model for short flavour text (failure messages, victory epilogue)
+FLAVOR_MODEL = os.getenv('OPENAI_FLAVOR_MODEL', 'gpt-4o-mini')
+OPENAI_MAX_CONCURRENCY = int(os.getenv('OPENAI_MAX_CONCURRENCY', 8))
+# Share of those slots speculative prefetches may hold at once - the rest stay free for live requests
+OPENAI_PREFETCH_CONCURRENCY = int(os.getenv('OPENAI_PREFETCH_CONCURRENCY', max(1, OPENAI_MAX_CONCURRENCY // 4)))
+OPENAI_RPM = int(os.getenv('OPENAI_RPM', 500))
+
+class RateLimiter:
+    """Caps concurrent OpenAI requests and spaces them out to stay under a requests-per-minute budget"""
+
+    def __init__(self, rpm: int, max_concurrency: int):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.lock = asyncio.Lock()  # Hands out tokens in arrival order
+        self.rate = rpm / 60  # Tokens added per second
+        self.capacity = max_concurrency  # Largest burst allowed after a quiet spell
+        self.tokens = float(max_concurrency)
+        self.updated_at = time.monotonic()
+
+    def refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def __aenter__(self):
+        await self.semaphore.acquire()
+        try:
+            async with self.lock:
+                self.refill()
+                if self.tokens < 1:
+                    # Wait for the bucket rather than letting OpenAI answer with a 429
+                    await asyncio.sleep((1 - self.tokens) / self.rate)
+                    self.refill()
+                self.tokens -= 1
+        except BaseException:
+            self.semaphore.release()
+            raise
+        return self
 
-        # Send immediate response
-        initial_embed = discord.Embed(
-            title="Generating Your Adventure",
-            description="```Crafting a unique quest just for you...```",
-            color=0x2b2d31  # Discord's dark theme gray, matches the UI
+    async def __aexit__(self, exc_type, exc, tb):
+        self.semaphore.release()
+
+# Shared by every game so bursts of scene generation queue up here instead of hitting 429s
+openai_rate_limiter = RateLimiter(OPENAI_RPM, OPENAI_MAX_CONCURRENCY)
+prefetch_semaphore = asyncio.Semaphore(OPENAI_PREFETCH_CONCURRENCY)
+
+async def create_chat_completion(on_text: Optional[Callable[[str, int], bool]] = None, **kwargs) -> str:
+    """Stream a chat completion and return its text, retrying rate limits and transient errors with exponential backoff.
+    on_text, if given, is called with the attempt's text so far and the offset the new piece starts at each time
+    more arrives (so a retry starts over at offset 0). It stops being called once it returns True"""
+    for attempt in range(OPENAI_MAX_ATTEMPTS):
+        try:
+            async with openai_rate_limiter:
+                # Stream so tokens are read off the socket as they are generated
+                stream = await openai_client.chat.completions.create(stream=True, **kwargs)
+                text = ""
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        offset = len(text)
+                        text += chunk.choices[0].delta.content
+                        if on_text is not None and on_text(text, offset):
+                            on_text = None
+                return text
+        except (openai.APIError, httpx.TransportError) as e:
+            # Failures while reading the stream surface as raw httpx errors, or as an APIError without a
+            # status code for SSE error events. Other status errors (bad request, auth) won't fix themselves
+            retryable = (not isinstance(e, openai.APIStatusError)
+                         or isinstance(e, (openai.RateLimitError, openai.InternalServerError)))
+            if not retryable or attempt == OPENAI_MAX_ATTEMPTS - 1:
+                raise
+
+            delay = min(OPENAI_MAX_RETRY_DELAY, 2 ** attempt) + random.random()
+            # Prefer the server's own hint when it gives one
+            response = getattr(e, "response", None)
+            retry_after = response.headers.get("retry-after") if response is not None else None
+            if retry_after:
+                try:
+                    delay = min(OPENAI_MAX_RETRY_DELAY, float(retry_after))
+                except ValueError:
+                    pass
+
+            logger.warning("OpenAI request failed (%s), retrying in %.1fs", type(e).__name__, delay)
+            await asyncio.sleep(delay)
+
+# Shared error embed for failed commands - built once and reused
+ERROR_EMBED = discord.Embed(
+    title="❌ Error",
+    description="An error occurred. Please try again.",
+    color=0xff0000  # Red for error state
+)
+
+def safe_command(func):
+    """Wrap a slash command so any unhandled error is logged and reported with ERROR_EMBED"""
+    # Per-command child logger, e.g. "AdventureGame.start", bound once at decoration time
+    command_logger = logger.getChild(func.__name__)
+
+    @functools.wraps(func)
+    async def wrapper(interaction: discord.Interaction, *args, **kwargs):
+        try:
+            return await func(interaction, *args, **kwargs)
+        except Exception as e:
+            command_logger.error("Error in command: %s", e)
+            # If we haven't responded yet, send new message, otherwise edit the existing one
+            if not interaction.response.is_done():
+                await interaction.response.send_message(embed=ERROR_EMBED, ephemeral=True)
+            else:
+                await interaction.edit_original_response(embed=ERROR_EMBED)
+    return wrapper
+
+# Fixed-shape embeds for /inventory and /session; copied and filled in per call
+INVENTORY_EMBED_TEMPLATE = {
+    "title": "",
+    "color": 0x2f3136,
+    "fields": [
+        {"name": "📊 Stats", "value": "", "inline": False},
+        {"name": "🗃️ Items", "value": "", "inline": False},
+        {"name": "🏆 Achievements", "value": "", "inline": False}
+    ]
+}
+
+SESSION_EMBED_TEMPLATE = {
+    "title": "Game Session Status",
+    "color": 0x2f3136,
+    "fields": [
+        {"name": "Status", "value": "", "inline": True},
+        {"name": "Time Remaining", "value": "", "inline": True}
+    ]
+}
+
+@client.tree.command(name="start", description="Start a new adventure")
+@app_commands.describe(cheap="Generate through the OpenAI Batch API - cheaper, but can take hours")
+@safe_command
+async def start(interaction: discord.Interaction, cheap: bool = False):
+    pending = game.sessions.get(interaction.user.id)
+    if pending is not None and pending.gen_status.status == "batched":
+        await interaction.response.send_message(
+            "Your adventure is still being generated. Use /status to check on it!",
+            ephemeral=True
+        )
+        return
+    if cheap and pending is not None and pending.gen_status.status == "ready":
+        # Queuing another batch would replace the finished one that's already been paid for
+        await interaction.response.send_message(
+            "Your adventure is ready! Use /start without `cheap` to play it.",
+            ephemeral=True
         )
-        initial_embed.add_field(
-            name="```Please Wait```",
-            value="```Your adventure is being prepared. This may take a few seconds.```",
-            inline=False
+        return
+
+    # Create a session first
+    success, message = session_manager.create_session(interaction.user.id, interaction.channel_id)
+    if not success:
+        await interaction.response.send_message(message, ephemeral=True)
+        return
+
+    if cheap:
+        # Nothing to play until the batch completes, so don't hold a session open for it
+        session_manager.end_session(interaction.user.id)
+        await interaction.response.defer(ephemeral=True)
+        await game.start_batch_game(interaction.user.id, interaction.channel_id)
+        await interaction.followup.send(
+            "📦 Your adventure has been queued! I'll ping you here when it's ready - then use /start to play.",
+            ephemeral=True
         )
-        response = await interaction.response.send_message(embed=initial_embed)
+        return
+
+    async def show_preview(quest_name: str, description: str):
+        # Generation starts before the defer, so the response may not exist yet
+        if interaction.response.is_done():
+            await interaction.edit_original_response(embed=game.create_preview_embed(quest_name, description))
+
+    # A batch game that's finished generating is picked up instead of starting a new one
+    player = game.take_ready_game(interaction.user.id)
+    # Kick off generation before acknowledging so the OpenAI round-trips overlap the Discord one
+    game_task = asyncio.create_task(game.start_game(interaction, show_preview)) if player is None else None
+    try:
+        # Acknowledge now - Discord shows "thinking..." until the game is sent
+        await interaction.response.defer(thinking=True)
         
-        # Generate the game in the background
-        player = await game.start_game(interaction)
+        # Wait for the game generated in the background
+        if game_task is not None:
+            player = await game_task
         game_embed = await game.create_game_embed(player)
         
-        # Update the message with the actual game content
+        # Replaces the "thinking..." message, or the opening preview if one was shown
         message = await interaction.edit_original_response(
             embed=game_embed,
-            view=AdventureView(game, player)
-        )
-        
-        # Register the message ID with the session manager
-        session_manager.register_message(interaction.user.id, message.id)
-        
-    except Exception as e:
-        session_manager.end_session(interaction.user.id)
-        logger.error(f"Error in start command: {e}")
-        error_embed = discord.Embed(
-            title="❌ Error",
-            description="An error occurred while generating your adventure. Please try again.",
-            color=0xff0000  # Red for error state
+            view=game.get_view(player)
         )
-        # If we haven't responded yet, send new message
-        if not interaction.response.is_done():
-            await interaction.response.send_message(embed=error_embed)
-        else:
-            # If we already responded, edit the existing message
-            await interaction.edit_original_response(embed=error_embed)
+    except Exception:
+        # Don't leave a half-created game running or blocking the next /start
+        if game_task is not None:
+            game_task.cancel()
+        game.cleanup_user(interaction.user.id)
+        raise
+    
+    # Register the message ID with the session manager
+    session_manager.register_message(interaction.user.id, message.id)
 
 @client.tree.command(name="status", description="Check the status of your adventure generation")
+@safe_command
 async def status(interaction: discord.Interaction):
-    user_id = interaction.user.id
-    
-    if user_id not in game.generation_status:
+    user_session = game.sessions.get(interaction.user.id)
+    if not user_session:
         await interaction.response.send_message(
             content="You don't have any adventures being generated. Use /start to begin!",
             ephemeral=True
         )
         return
 
-    status = game.generation_status[user_id]
-    if status['status'] == 'generating':
-        minutes_remaining = int(status.get('time_remaining', 0) / 60)
+    status = user_session.gen_status
+    # ProgressSlot fields are only written from the event loop, so reading them here
+    # without an await in between always gives a consistent view
+    if status.status == 'generating':
+        minutes_remaining = int(status.time_remaining / 60)
         await interaction.response.send_message(
             content=f"🎮 Your adventure is being prepared!\n"
-                   f"Progress: {status['progress']:.1f}%\n"
-                   f"Scenes completed: {status['completed_scenes']}/{status['total_scenes']}\n"
+                   f"Progress: {status.progress:.1f}%\n"
+                   f"Scenes completed: {status.completed_scenes}/{status.total_scenes}\n"
                    f"Estimated time remaining: {minutes_remaining} minutes",
             ephemeral=True
         )
-    elif status['status'] == 'complete':
+    elif status.status == 'batched':
+        # The batch lookup can outlast Discord's 3 second window for a first response
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        batch = await openai_client.batches.retrieve(status.batch_id)
+        counts = batch.request_counts
+        await interaction.edit_original_response(
+            content=f"📦 Your adventure is queued in an OpenAI batch!\n"
+                   f"Batch status: {batch.status}\n"
+                   f"Requests completed: {counts.completed if counts else 0}/{counts.total if counts else 1}\n"
+                   f"I'll ping you when it's ready."
+        )
+    elif status.status in ('complete', 'ready'):
         await interaction.response.send_message(
             content="✅ Your adventure is ready! Use /start to begin playing!",
             ephemeral=True
@@ -980,46 +1747,27 @@ async def status(interaction: discord.Interaction):
         )
 
 @client.tree.command(name="inventory", description="View your inventory and stats!")
+@safe_command
 async def inventory(interaction: discord.Interaction):
-    try:
-        player = game.get_player(interaction.user.id)
-        if not player:
-            await interaction.response.send_message("You don't have an active game! Use /start to begin.", ephemeral=True)
-            return
-            
-        embed = discord.Embed(
-            title=f"🎒 {interaction.user.name}'s Inventory",
-            color=0x2f3136
-        )
-        
-        embed.add_field(
-            name="📊 Stats",
-            value=f"Level: {player.inventory.level}\nXP: {player.inventory.xp}/{player.inventory.get_next_level_xp()}\nCoins: {player.inventory.coins}",
-            inline=False
-        )
-        
-        items_text = ""
-        for item in player.inventory.items:
-            effects = ", ".join(f"{k}: {v}" for k, v in item.effects.items())
-            items_text += f"• {item.name} ({item.rarity})\n  {item.description}\n  Effects: {effects}\n"
-        
-        embed.add_field(
-            name="🗃️ Items",
-            value=items_text or "No items yet!",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🏆 Achievements",
-            value=f"Items Found: {player.inventory.stats['items_found']}\nCoins Earned: {player.inventory.stats['coins_earned']}\nSuccessful Choices: {player.inventory.stats['successful_choices']}\nRisky Choices Survived: {player.inventory.stats['risky_choices_survived']}",
-            inline=False
-        )
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+    player = game.get_player(interaction.user.id)
+    if not player:
+        await interaction.response.send_message("You don't have an active game! Use /start to begin.", ephemeral=True)
+        return
         
-    except Exception as e:
-        logger.error(f"Error in inventory command: {e}")
-        await interaction.response.send_message("An error occurred. Please try again.", ephemeral=True)
+    items_text = ""
+    for item in player.inventory.items:
+        effects = ", ".join(f"{k}: {v}" for k, v in item.effects.items())
+        items_text += f"• {item.name} ({item.rarity})\n  {item.description}\n  Effects: {effects}\n"
+    
+    embed_data = copy.deepcopy(INVENTORY_EMBED_TEMPLATE)
+    embed_data["title"] = f"🎒 {interaction.user.name}'s Inventory"
+    stats_field, items_field, achievements_field = embed_data["fields"]
+    stats_field["value"] = f"Level: {player.inventory.level}\nXP: {player.inventory.xp}/{player.inventory.get_next_level_xp()}\nCoins: {player.inventory.coins}"
+    items_field["value"] = items_text or "No items yet!"
+    achievements_field["value"] = f"Items Found: {player.inventory.stats['items_found']}\nCoins Earned: {player.inventory.stats['coins_earned']}\nSuccessful Choices: {player.inventory.stats['successful_choices']}\nRisky Choices Survived: {player.inventory.stats['risky_choices_survived']}"
+    embed = discord.Embed.from_dict(embed_data)
+    
+    await interaction.response.send_message(embed=embed, ephemeral=True)
 
 class RewardManager:
     def __init__(self):
@@ -1062,106 +1810,122 @@ class RewardManager:
 
 reward_manager = RewardManager()
 
-@tasks.loop(minutes=5)
-async def cleanup_sessions():
-    try:
-        expired = await session_manager.check_sessions(client)
-        if expired:
-            logger.info(f"Cleaned up {len(expired)} expired game sessions")
-            
-            # Clean up game states for expired sessions
-            for user_id in expired:
-                if user_id in game.active_games:
-                    del game.active_games[user_id]
-                if user_id in game.generation_status:
-                    del game.generation_status[user_id]
-                    
-    except Exception as e:
-        logger.error(f"Error in cleanup_sessions: {e}")
+CLEANUP_INTERVAL = 5 * 60           # seconds between cleanup runs
+CLEANUP_IDLE_INTERVAL = 15 * 60     # slower interval while nobody is playing
+CLEANUP_MAX_BACKOFF = 60 * 60       # cap for the error backoff
+CLEANUP_IDLE_RUNS_BEFORE_BACKOFF = 3
+
+async def poll_batch_games() -> bool:
+    """Build finished Batch API games and tell their players. Returns False if none were queued"""
+    if not any(session.gen_status.status == "batched" for session in game.sessions.values()):
+        return False
+
+    for user_id in await game.poll_batches():
+        session = game.sessions.get(user_id)
+        channel = client.get_channel(session.channel_id) if session is not None else None
+        if channel:
+            try:
+                await channel.send(f"<@{user_id}> Your adventure is ready! Use `/start` to begin playing!")
+            except Exception as e:
+                logger.error("Failed to announce batch game: %s", e)
+    return True
+
+async def cleanup_sessions() -> bool:
+    """Expire idle sessions, drop their game state and finish batch games. Returns False if there was nothing to check"""
+    # Batch games aren't in session_manager until they're picked up, so poll them first
+    polled = await poll_batch_games()
+    if not session_manager.sessions:
+        return polled
+
+    expired = await session_manager.check_sessions(client)
+    if expired:
+        logger.info("Cleaned up %d expired game sessions", len(expired))
+        
+        # Clean up game states for expired sessions
+        for user_id in expired:
+            game.cleanup_user(user_id)
+    return True
+
+async def cleanup_forever():
+    """Run cleanup_sessions for the lifetime of the bot, backing off while idle or failing"""
+    interval = CLEANUP_INTERVAL
+    idle_runs = 0
+    while True:
+        try:
+            idle_runs = 0 if await cleanup_sessions() else idle_runs + 1
+            interval = CLEANUP_IDLE_INTERVAL if idle_runs > CLEANUP_IDLE_RUNS_BEFORE_BACKOFF else CLEANUP_INTERVAL
+        except Exception as e:
+            # One bad run shouldn't stop cleanup for good - retry later with a longer wait
+            logger.error("Error in cleanup_sessions: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            interval = min(interval * 2, CLEANUP_MAX_BACKOFF)
+        await asyncio.sleep(interval)
 
 @client.tree.command(name="session", description="Check your current game session status")
+@safe_command
 async def session_status(interaction: discord.Interaction):
     """Check the status of your current game session"""
-    try:
-        session = session_manager.get_session(interaction.user.id)
-        if not session:
-            await interaction.response.send_message(
-                "You don't have an active game session.",
-                ephemeral=True
-            )
-            return
-        
-        # Calculate time remaining
-        time_since_interaction = datetime.now() - session.last_interaction
-        time_remaining = timedelta(minutes=session_manager.timeout_minutes) - time_since_interaction
-        
-        embed = discord.Embed(
-            title="Game Session Status",
-            color=0x2f3136
-        )
-        
-        embed.add_field(
-            name="Status",
-            value=session.state.value.title(),
-            inline=True
-        )
-        
-        embed.add_field(
-            name="Time Remaining",
-            value=f"{int(time_remaining.total_seconds() / 60)} minutes",
-            inline=True
-        )
-        
-        if interaction.user.id in game.active_games:
-            player = game.active_games[interaction.user.id]
-            embed.add_field(
-                name="Current Game",
-                value=f"Quest: {player.quest_name}\nScene: {player.current_scene_number}/{game.MAX_SCENES}\nLives: {player.lives_remaining}/{player.max_lives}",
-                inline=False
-            )
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        
-    except Exception as e:
-        logger.error(f"Error in session_status command: {e}")
+    session = session_manager.get_session(interaction.user.id)
+    if not session:
         await interaction.response.send_message(
-            "An error occurred while checking your session status.",
+            "You don't have an active game session.",
             ephemeral=True
         )
+        return
+    
+    # Calculate time remaining
+    time_since_interaction = datetime.now() - session.last_interaction
+    time_remaining = timedelta(minutes=session_manager.timeout_minutes) - time_since_interaction
+    
+    embed_data = copy.deepcopy(SESSION_EMBED_TEMPLATE)
+    status_field, time_field = embed_data["fields"]
+    status_field["value"] = session.state.value.title()
+    time_field["value"] = f"{int(time_remaining.total_seconds() / 60)} minutes"
+    
+    player = game.get_player(interaction.user.id)
+    if player is not None:
+        embed_data["fields"].append({
+            "name": "Current Game",
+            "value": f"Quest: {player.quest_name}\nScene: {player.current_scene_number}/{game.MAX_SCENES}\nLives: {player.lives_remaining}/{player.max_lives}",
+            "inline": False
+        })
+    
+    embed = discord.Embed.from_dict(embed_data)
+    
+    await interaction.response.send_message(embed=embed, ephemeral=True)
 
 @client.tree.command(name="end", description="End your current game session")
 @app_commands.guild_only()  # Optional: restrict to guilds only
+@safe_command
 async def end(interaction: discord.Interaction):
     """End the current game session"""
-    try:
-        session = session_manager.get_session(interaction.user.id)
-        if not session:
-            await interaction.response.send_message(
-                "You don't have an active game session.",
-                ephemeral=True
-            )
-            return
-        
-        # End the session
-        session_manager.end_session(interaction.user.id)
-        
-        # Clean up game state if it exists
-        if interaction.user.id in game.active_games:
-            del game.active_games[interaction.user.id]
-        if interaction.user.id in game.generation_status:
-            del game.generation_status[interaction.user.id]
-        
+    session = session_manager.get_session(interaction.user.id)
+    # Batch API games have no manager session until they're picked up, but can still be ended
+    game_session = game.sessions.get(interaction.user.id)
+    if not session and game_session is None:
         await interaction.response.send_message(
-            "Your game session has been ended. Use `/start` to begin a new adventure!",
-            ephemeral=True
-        )
-        
-    except Exception as e:
-        logger.error(f"Error in end command: {e}")
-        await interaction.response.send_message(
-            "An error occurred while ending your session.",
+            "You don't have an active game session.",
             ephemeral=True
         )
+        return
+    
+    batch_id = None
+    if game_session is not None and game_session.gen_status.status == "batched":
+        batch_id = game_session.gen_status.batch_id
+    
+    # End the session and clean up game state if it exists
+    game.cleanup_user(interaction.user.id)
+    
+    await interaction.response.send_message(
+        "Your game session has been ended. Use `/start` to begin a new adventure!",
+        ephemeral=True
+    )
+    
+    # Stop paying for a batch nobody is waiting on any more
+    if batch_id is not None:
+        try:
+            await openai_client.batches.cancel(batch_id)
+        except Exception as e:
+            logger.error("Failed to cancel batch %s: %s", batch_id, e)
 
 # Make sure to sync commands on startup
 @client.event
@@ -1171,7 +1935,7 @@ async def on_ready():
         logger.info(f'Logged in as {client.user} (ID: {client.user.id})')
         logger.info('------')
     except Exception as e:
-        logger.error(f"Error syncing commands: {e}")
+        logger.error("Error syncing commands: %s", e)
 
 # Color constants for consistent UI
 COLORS = {